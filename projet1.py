@@ -1,5 +1,8 @@
 from ortools.sat.python import cp_model
+import numpy as np
+import argparse
 import json
+import math
 import time
 import os
 from datetime import datetime
@@ -9,15 +12,137 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
 
+try:
+    import orjson
+    
+    def _load_json(path):
+        """Charge un fichier JSON avec orjson, ou avec json si orjson le refuse."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejette NaN/Infinity, que le module json standard accepte
+            return json.loads(data)
+except ImportError:
+    # orjson absent : module json standard
+    def _load_json(path):
+        """Charge un fichier JSON avec le module json standard."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba absent : les fonctions décorées restent en Python pur
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Noms des jours et des périodes (indexés par d-1 et p-1)
+_DAY_NAMES = ("Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi")
+_PERIOD_NAMES = (
+    "7h00-9h55",
+    "10h05-12h55",
+    "13h05-15h55",
+    "16h05-18h55",
+    "19h05-21h55",
+)
+
+# Styles du PDF, construits une seule fois pour toutes les générations
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    name='TitleStyle',
+    parent=_STYLES['Title'],
+    fontSize=24,
+    leading=30,
+    alignment=1,  # Centre
+    spaceAfter=0.5*cm
+)
+_HEADING_STYLE = ParagraphStyle(
+    name='HeadingStyle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    textColor=colors.blue,
+    spaceAfter=0.3*cm
+)
+
+# Couleurs pour les périodes
+_PERIOD_COLORS = {
+    1: colors.Color(0.8, 1, 0.8),  # Vert clair pour le matin tôt
+    2: colors.Color(0.9, 1, 0.9),  # Vert très clair pour le matin
+    3: colors.Color(1, 1, 0.8),    # Jaune clair pour le midi
+    4: colors.Color(1, 0.9, 0.8),  # Orange clair pour l'après-midi
+    5: colors.Color(1, 0.8, 0.8)   # Rouge clair pour le soir
+}
+
+# Style des tableaux, identique pour toutes les classes, avec une couleur de fond
+# par ligne de période
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('WORDWRAP', (0, 0), (-1, -1), True),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+] + [('BACKGROUND', (1, p), (-1, p), color) for p, color in _PERIOD_COLORS.items()])
+
+@njit(cache=True)
+def _greedy_assign(course_class, teacher_ptr, teacher_ids, n_classes, n_teachers, n_rooms, n_days, n_periods):
+    """Place chaque cours, dans l'ordre donné, au premier créneau (période, jour) sans conflit.
+    
+    Retourne un tableau (nombre de cours, 4) d'indices [jour, période, salle, enseignant],
+    à -1 pour les cours non placés.
+    """
+    busy_class = np.zeros((n_classes, n_days, n_periods), dtype=np.bool_)
+    busy_teacher = np.zeros((n_teachers, n_days, n_periods), dtype=np.bool_)
+    busy_room = np.zeros((n_rooms, n_days, n_periods), dtype=np.bool_)
+    
+    n_courses = course_class.shape[0]
+    assignments = np.full((n_courses, 4), -1, dtype=np.int64)
+    for k in range(n_courses):
+        l = course_class[k]
+        placed = False
+        # Périodes en boucle externe pour remplir les matinées en priorité
+        for p in range(n_periods):
+            for d in range(n_days):
+                if busy_class[l, d, p]:
+                    continue
+                t = -1
+                for i in range(teacher_ptr[k], teacher_ptr[k + 1]):
+                    if not busy_teacher[teacher_ids[i], d, p]:
+                        t = teacher_ids[i]
+                        break
+                r = -1
+                for j in range(n_rooms):
+                    if not busy_room[j, d, p]:
+                        r = j
+                        break
+                if t < 0 or r < 0:
+                    continue
+                busy_class[l, d, p] = True
+                busy_teacher[t, d, p] = True
+                busy_room[r, d, p] = True
+                assignments[k, 0] = d
+                assignments[k, 1] = p
+                assignments[k, 2] = r
+                assignments[k, 3] = t
+                placed = True
+                break
+            if placed:
+                break
+    
+    return assignments
+
 class TimeTableGenerator:
     def __init__(self, subjects_file, rooms_file):
         """Initialise le générateur d'emploi du temps avec les fichiers de données."""
         # Chargement des données
-        with open(subjects_file, 'r', encoding='utf-8') as f:
-            self.subjects_data = json.load(f)
-        
-        with open(rooms_file, 'r', encoding='utf-8') as f:
-            self.rooms_data = json.load(f)
+        self.subjects_data = _load_json(subjects_file)
+        self.rooms_data = _load_json(rooms_file)
         
         # Initialisation des données
         self.L = []  # Classes (L pour Level-semester)
@@ -39,6 +164,12 @@ class TimeTableGenerator:
         # Crédits des cours (pour priorisation)
         self.course_credits = {}  # c -> valeur
         
+        # Charge des enseignants : nombre de cours (l, c) qu'ils peuvent assurer
+        self.teacher_load = {}  # t -> nombre de cours
+        
+        # Noms d'enseignants tronqués pour l'affichage dans le PDF
+        self.teacher_display = {}  # t -> nom tronqué
+        
         # Extraction des données
         self.extract_data()
 
@@ -53,6 +184,11 @@ class TimeTableGenerator:
         # Enseignant par défaut pour les cours sans enseignant
         default_teacher = "ENSEIGNANT_DEFAUT"
         
+        # Ensembles parallèles aux listes pour des tests d'appartenance en O(1)
+        known_courses = set()
+        known_teachers = set()
+        course_teacher_sets = {}  # c -> ensemble des enseignants de c
+        
         # 1. Extraction des classes, cours et enseignants
         for level, level_data in self.subjects_data['niveau'].items():
             for semester, semester_data in level_data.items():
@@ -65,15 +201,29 @@ class TimeTableGenerator:
                     if not course_code:
                         continue
                     
-                    if course_code not in self.C:
+                    if course_code not in known_courses:
+                        known_courses.add(course_code)
                         self.C.append(course_code)
                         self.course_teachers[course_code] = []
-                        try:
-                            self.course_credits[course_code] = int(subject.get('credit', 0))
-                        except:
-                            self.course_credits[course_code] = 0
+                        course_teacher_sets[course_code] = set()
+                        credit = subject.get('credit', 0)
+                        if isinstance(credit, str):
+                            # Au plus un signe, puis uniquement des chiffres décimaux : contrairement
+                            # à int(), les séparateurs « _ » (« 1_0 ») sont refusés et valent 0
+                            digits = credit.strip()
+                            if digits[:1] in ('+', '-'):
+                                digits = digits[1:]
+                            credit = int(credit) if digits.isdecimal() else 0
+                        elif isinstance(credit, float):
+                            credit = int(credit) if math.isfinite(credit) else 0
+                        elif isinstance(credit, int):
+                            credit = int(credit)  # bool -> 0/1
+                        else:
+                            credit = 0
+                        self.course_credits[course_code] = credit
                     
                     self.programme[class_name].append(course_code)
+                    teachers_of_course = course_teacher_sets[course_code]
                     
                     # Extraction des enseignants
                     teachers_found = False
@@ -83,9 +233,11 @@ class TimeTableGenerator:
                         for lecturer in subject['Course Lecturer']:
                             lecturer = self.clean_string(lecturer)
                             if lecturer:
-                                if lecturer not in self.T:
+                                if lecturer not in known_teachers:
+                                    known_teachers.add(lecturer)
                                     self.T.append(lecturer)
-                                if lecturer not in self.course_teachers[course_code]:
+                                if lecturer not in teachers_of_course:
+                                    teachers_of_course.add(lecturer)
                                     self.course_teachers[course_code].append(lecturer)
                                 teachers_found = True
                     
@@ -94,129 +246,196 @@ class TimeTableGenerator:
                         for lecturer in subject['Assitant lecturer']:
                             lecturer = self.clean_string(lecturer)
                             if lecturer:
-                                if lecturer not in self.T:
+                                if lecturer not in known_teachers:
+                                    known_teachers.add(lecturer)
                                     self.T.append(lecturer)
-                                if lecturer not in self.course_teachers[course_code]:
+                                if lecturer not in teachers_of_course:
+                                    teachers_of_course.add(lecturer)
                                     self.course_teachers[course_code].append(lecturer)
                                 teachers_found = True
                     
                     # Ajout d'un enseignant par défaut si nécessaire
                     if not teachers_found:
-                        if default_teacher not in self.T:
+                        if default_teacher not in known_teachers:
+                            known_teachers.add(default_teacher)
                             self.T.append(default_teacher)
                         self.course_teachers[course_code].append(default_teacher)
         
+        # Les listes d'enseignants ne changent plus : on les fige en tuples
+        self.course_teachers = {c: tuple(teachers) for c, teachers in self.course_teachers.items()}
+        
+        # Charge des enseignants (un cours listé deux fois dans un programme compte une fois)
+        self.teacher_load = {t: 0 for t in self.T}
+        for l in self.L:
+            for c in dict.fromkeys(self.programme[l]):
+                for t in self.course_teachers[c]:
+                    self.teacher_load[t] += 1
+        
         # 2. Extraction des salles
         for room in self.rooms_data['Informatique']:
             room_num = self.clean_string(room['num'])
             if room_num:
                 self.R.append(room_num)
         
+        # Noms d'enseignants tronqués une seule fois pour le PDF
+        self.teacher_display = {t: self.truncate_text(t) for t in self.T}
+        
         print(f"Données extraites: {len(self.L)} classes, {len(self.C)} cours, {len(self.R)} salles, {len(self.T)} enseignants")
         print(f"Total de cours à programmer: {sum(len(courses) for courses in self.programme.values())}")
         print(f"Total de créneaux disponibles: {len(self.D) * len(self.P)}")
 
-    def generate_timetable(self):
-        """Génère l'emploi du temps avec une approche relâchée permettant une solution partielle."""
+    def greedy_schedule(self):
+        """Affecte gloutonnement les cours, par crédits décroissants, au premier créneau libre.
+        
+        Retourne un dictionnaire (l, c) -> (d, p, r, t) des cours placés sans conflit.
+        """
+        courses = [(l, c) for l in self.L for c in dict.fromkeys(self.programme[l])]
+        courses.sort(key=lambda lc: self.course_credits.get(lc[1], 0), reverse=True)
+        
+        # Passage aux indices entiers : enseignants des cours au format CSR
+        class_index = {l: i for i, l in enumerate(self.L)}
+        teacher_index = {t: i for i, t in enumerate(self.T)}
+        course_class = np.array([class_index[l] for l, c in courses], dtype=np.int64)
+        teacher_ptr = np.zeros(len(courses) + 1, dtype=np.int64)
+        teacher_ids = []
+        for k, (l, c) in enumerate(courses):
+            teacher_ids.extend(teacher_index[t] for t in self.course_teachers[c])
+            teacher_ptr[k + 1] = len(teacher_ids)
+        teacher_ids = np.array(teacher_ids, dtype=np.int64)
+        
+        assignments = _greedy_assign(course_class, teacher_ptr, teacher_ids,
+                                     len(self.L), len(self.T), len(self.R),
+                                     len(self.D), len(self.P))
+        
+        assignment = {}
+        for (l, c), (d_idx, p_idx, r_idx, t_idx) in zip(courses, assignments.tolist()):
+            if d_idx >= 0:
+                assignment[(l, c)] = (self.D[d_idx], self.P[p_idx], self.R[r_idx], self.T[t_idx])
+        
+        return assignment
+
+    def generate_timetable(self, use_hint=False):
+        """Génère l'emploi du temps avec une approche relâchée permettant une solution partielle.
+        
+        Si use_hint est vrai, la solution de greedy_schedule est fournie au solveur comme
+        indication de départ (désactivé par défaut : les indications peuvent ralentir CP-SAT).
+        En ligne de commande : python projet1.py --hint
+        """
         print("\nTentative avec approche relâchée (solution partielle)...")
         
         # Création du modèle
         model = cp_model.CpModel()
         
-        # 1. VARIABLES DE DÉCISION
-        # x[l,c,r,d,p,t] = 1 si la classe l suit le cours c dans la salle r pendant 
-        # la période p du jour d avec l'enseignant t, 0 sinon
-        x = {}
+        # Les créneaux (jour, période) sont numérotés de 0 à |D|·|P|-1 :
+        # s = (indice du jour) * |P| + (indice de la période)
+        n_slots = len(self.D) * len(self.P)
         
-        # Création des variables uniquement pour les combinaisons valides
-        for l in self.L:
-            for c in self.programme[l]:
-                for r in self.R:
-                    for d in self.D:
-                        for p in self.P:
-                            for t in self.course_teachers[c]:
-                                x[(l, c, r, d, p, t)] = model.NewBoolVar(f'x_{l}_{c}_{r}_{d}_{p}_{t}')
+        # Un enseignant qui n'a qu'un cours ne peut pas être en conflit : inutile de
+        # poser ses contraintes de non-chevauchement.
+        shared_teachers = {t for t, load in self.teacher_load.items() if load > 1}
         
-        # Variable y[l,c] = 1 si le cours c de la classe l est programmé, 0 sinon
+        # 1. VARIABLES DE DÉCISION
+        # x[l,c,s,t] = 1 si la classe l suit le cours c au créneau s avec l'enseignant t
+        # y[l,c] = 1 si le cours c de la classe l est programmé, 0 sinon
+        # Les salles sont interchangeables : le modèle ne limite que le nombre de cours
+        # simultanés à len(R), et les salles sont attribuées après la résolution.
         y = {}
+        # (l, c, y, [(s, t, x[l,c,s,t]), ...]) pour chaque cours, relu directement après la résolution
+        course_vars = []
+        
+        # Littéraux regroupés par ressource et par créneau pour les contraintes de conflit
+        class_lits = {l: [[] for s in range(n_slots)] for l in self.L}
+        teacher_lits = {t: [[] for s in range(n_slots)] for t in shared_teachers}
+        slot_lits = [[] for s in range(n_slots)]
+        
+        # Références locales pour la boucle de création des variables
+        course_teachers = self.course_teachers
+        NewBoolVar = model.NewBoolVar
+        
         for l in self.L:
+            class_lits_l = class_lits[l]
             for c in self.programme[l]:
-                y[(l, c)] = model.NewBoolVar(f'y_{l}_{c}')
+                lc = (l, c)
+                if lc in y:
+                    # Cours listé deux fois dans le programme : une seule séance à planifier
+                    continue
+                presence = y[lc] = NewBoolVar(f'y_{l}_{c}')
+                teachers_c = course_teachers[c]
+                
+                lits = []
+                for s in range(n_slots):
+                    class_lits_s = class_lits_l[s]
+                    slot_lits_s = slot_lits[s]
+                    for t in teachers_c:
+                        lit = NewBoolVar('')
+                        lits.append((s, t, lit))
+                        class_lits_s.append(lit)
+                        slot_lits_s.append(lit)
+                        if t in shared_teachers:
+                            teacher_lits[t][s].append(lit)
+                course_vars.append((l, c, presence, lits))
                 
-                # Liaison entre x et y : y[l,c] = 1 ssi le cours est programmé quelque part
-                model.Add(y[(l, c)] == sum(x.get((l, c, r, d, p, t), 0)
-                                         for r in self.R
-                                         for d in self.D
-                                         for p in self.P
-                                         for t in self.course_teachers[c]))
+                # Liaison avec y : un cours programmé a exactement un créneau et un enseignant,
+                # aucun sinon
+                model.AddExactlyOne([lit for s, t, lit in lits] + [presence.Not()])
         
         # 2. CONTRAINTES
         
         # Contrainte 1: Pas de conflits d'horaire pour une classe
-        for l in self.L:
-            for d in self.D:
-                for p in self.P:
-                    model.Add(sum(x.get((l, c, r, d, p, t), 0) 
-                               for c in self.programme[l]
-                               for r in self.R 
-                               for t in self.course_teachers[c]) 
-                           <= 1)
-        
-        # Contrainte 2: Chaque cours est programmé au plus une fois (et non exactement une fois)
-        for l in self.L:
-            for c in self.programme[l]:
-                model.Add(sum(x.get((l, c, r, d, p, t), 0)
-                           for r in self.R
-                           for d in self.D
-                           for p in self.P
-                           for t in self.course_teachers[c])
-                       <= 1)  # <= 1 au lieu de == 1
+        for class_lits_l in class_lits.values():
+            for lits in class_lits_l:
+                model.AddAtMostOne(lits)
         
         # Contrainte 3: Un enseignant ne peut pas donner deux cours simultanément
-        for t in self.T:
-            for d in self.D:
-                for p in self.P:
-                    model.Add(sum(x.get((l, c, r, d, p, t), 0)
-                               for l in self.L
-                               for c in self.programme[l] if t in self.course_teachers[c]
-                               for r in self.R)
-                           <= 1)
-        
-        # Contrainte 4: Une salle ne peut pas accueillir deux cours au même moment
-        for r in self.R:
-            for d in self.D:
-                for p in self.P:
-                    model.Add(sum(x.get((l, c, r, d, p, t), 0)
-                               for l in self.L
-                               for c in self.programme[l]
-                               for t in self.course_teachers[c])
-                           <= 1)
+        for teacher_lits_t in teacher_lits.values():
+            for lits in teacher_lits_t:
+                model.AddAtMostOne(lits)
         
-        # 3. FONCTION OBJECTIF: Maximiser le nombre de cours programmés ET les cours du matin
-        objective_terms = []
+        # Contrainte 4: Une salle ne peut pas accueillir deux cours au même moment :
+        # au plus len(R) cours par créneau, toutes classes confondues
+        n_rooms = len(self.R)
+        for lits in slot_lits:
+            model.Add(cp_model.LinearExpr.Sum(lits) <= n_rooms)
         
-        # Grand poids pour chaque cours programmé (priorité 1)
-        for l in self.L:
-            for c in self.programme[l]:
-                # Bonus pour le nombre de crédits
-                credit_bonus = self.course_credits.get(c, 0)
-                objective_terms.append(1000 * y[(l, c)] + credit_bonus * y[(l, c)])
-        
-        # Bonus pour les créneaux du matin (priorité 2)
-        for l in self.L:
-            for c in self.programme[l]:
-                for r in self.R:
-                    for d in self.D:
-                        for p in self.P:
-                            for t in self.course_teachers[c]:
-                                if (l, c, r, d, p, t) in x:
-                                    objective_terms.append(self.weights[p] * x[(l, c, r, d, p, t)])
-        
-        model.Maximize(sum(objective_terms))
+        # 3. FONCTION OBJECTIF: Maximiser le nombre de cours programmés ET les cours du matin
+        # Variables et coefficients collectés en parallèle pour LinearExpr.WeightedSum
+        objective_vars = []
+        objective_coeffs = []
+        
+        # Grand poids pour chaque cours programmé (priorité 1), et bonus pour les
+        # créneaux du matin (priorité 2) : weight_table[s] = poids de la période du créneau s
+        weight_table = [self.weights[p] for d in self.D for p in self.P]
+        for l, c, presence, lits in course_vars:
+            # Bonus pour le nombre de crédits, regroupé en un seul coefficient sur y
+            objective_vars.append(presence)
+            objective_coeffs.append(1000 + self.course_credits.get(c, 0))
+            for s, t, lit in lits:
+                objective_vars.append(lit)
+                objective_coeffs.append(weight_table[s])
+        
+        model.Maximize(cp_model.LinearExpr.WeightedSum(objective_vars, objective_coeffs))
+        
+        # Solution de départ gloutonne (optionnelle)
+        if use_hint:
+            greedy = self.greedy_schedule()
+            print(f"Pré-affectation gloutonne: {len(greedy)} cours sur {len(course_vars)}")
+            for l, c, presence, lits in course_vars:
+                if (l, c) in greedy:
+                    d, p, r, t_greedy = greedy[(l, c)]
+                    s_greedy = self.D.index(d) * len(self.P) + self.P.index(p)
+                    model.AddHint(presence, 1)
+                    for s, t, lit in lits:
+                        model.AddHint(lit, s == s_greedy and t == t_greedy)
+                else:
+                    model.AddHint(presence, 0)
+                    for s, t, lit in lits:
+                        model.AddHint(lit, 0)
         
         # 4. RÉSOLUTION
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = 600  # 10 minutes
+        # Portefeuille de stratégies en parallèle, un worker par cœur disponible
+        solver.parameters.num_workers = os.cpu_count() or 1
         
         print("\nRésolution du modèle en cours...")
         start_time = time.time()
@@ -231,23 +450,17 @@ class TimeTableGenerator:
             print("Solution partielle trouvée!")
             
             # Structure de données pour l'emploi du temps
-            timetable = {}
-            for l in self.L:
-                timetable[l] = {}
-                for d in self.D:
-                    timetable[l][d] = {}
-                    for p in self.P:
-                        timetable[l][d][p] = None
+            timetable = {l: {d: dict.fromkeys(self.P) for d in self.D} for l in self.L}
             
-            # Remplir l'emploi du temps
-            for l in self.L:
-                for c in self.programme[l]:
-                    for r in self.R:
-                        for d in self.D:
-                            for p in self.P:
-                                for t in self.course_teachers[c]:
-                                    if (l, c, r, d, p, t) in x and solver.Value(x[(l, c, r, d, p, t)]) == 1:
-                                        timetable[l][d][p] = (c, t, r)
+            # Remplir l'emploi du temps, en attribuant les salles libres créneau par créneau
+            n_periods = len(self.P)
+            free_rooms = {}  # s -> itérateur sur les salles encore libres au créneau s
+            for l, c, presence, lits in course_vars:
+                if solver.BooleanValue(presence):
+                    s, t = next((s, t) for s, t, lit in lits if solver.BooleanValue(lit))
+                    d_idx, p_idx = divmod(s, n_periods)
+                    r = next(free_rooms.setdefault(s, iter(self.R)))
+                    timetable[l][self.D[d_idx]][self.P[p_idx]] = (c, t, r)
             
             # Afficher l'emploi du temps
             self.display_timetable(timetable)
@@ -256,18 +469,8 @@ class TimeTableGenerator:
             self.generate_pdf(timetable)
             
             # Calculer et afficher les cours non programmés
-            scheduled_courses = set()
-            for l in self.L:
-                for d in self.D:
-                    for p in self.P:
-                        if timetable[l][d][p]:
-                            c = timetable[l][d][p][0]
-                            scheduled_courses.add((l, c))
-            
-            all_courses = set()
-            for l in self.L:
-                for c in self.programme[l]:
-                    all_courses.add((l, c))
+            scheduled_courses = {lc for lc, presence in y.items() if solver.BooleanValue(presence)}
+            all_courses = {(l, c) for l in self.L for c in self.programme[l]}
             
             unscheduled = all_courses - scheduled_courses
             if unscheduled:
@@ -320,25 +523,16 @@ class TimeTableGenerator:
     
     def display_timetable(self, timetable):
         """Affiche l'emploi du temps généré."""
-        day_names = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi"]
-        period_names = [
-            "7h00-9h55", 
-            "10h05-12h55", 
-            "13h05-15h55", 
-            "16h05-18h55", 
-            "19h05-21h55"
-        ]
-        
         for l in self.L:
             print(f"\n\n=== EMPLOI DU TEMPS - {l} ===\n")
             for d in self.D:
-                print(f"  {day_names[d-1]}:")
+                print(f"  {_DAY_NAMES[d-1]}:")
                 for p in self.P:
                     if timetable[l][d][p]:
                         c, t, r = timetable[l][d][p]
-                        print(f"    {period_names[p-1]}: {c} avec {t} dans {r}")
+                        print(f"    {_PERIOD_NAMES[p-1]}: {c} avec {t} dans {r}")
                     else:
-                        print(f"    {period_names[p-1]}: -")
+                        print(f"    {_PERIOD_NAMES[p-1]}: -")
         
         # Statistiques
         morning_courses = 0
@@ -372,95 +566,40 @@ class TimeTableGenerator:
                               rightMargin=1*cm, leftMargin=1*cm,
                               topMargin=1*cm, bottomMargin=1*cm)
         
-        # Définir les styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            name='TitleStyle',
-            parent=styles['Title'],
-            fontSize=24,
-            leading=30,
-            alignment=1,  # Centre
-            spaceAfter=0.5*cm
-        )
-        heading_style = ParagraphStyle(
-            name='HeadingStyle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            textColor=colors.blue,
-            spaceAfter=0.3*cm
-        )
-        normal_style = styles['Normal']
-        
-        # Couleurs pour les périodes
-        period_colors = {
-            1: colors.Color(0.8, 1, 0.8),  # Vert clair pour le matin tôt
-            2: colors.Color(0.9, 1, 0.9),  # Vert très clair pour le matin
-            3: colors.Color(1, 1, 0.8),    # Jaune clair pour le midi
-            4: colors.Color(1, 0.9, 0.8),  # Orange clair pour l'après-midi
-            5: colors.Color(1, 0.8, 0.8)   # Rouge clair pour le soir
-        }
-        
         # Liste des éléments à ajouter au document
         elements = []
         
         # Titre du document
-        elements.append(Paragraph("Emploi du Temps", title_style))
-        elements.append(Paragraph("Département d'Informatique - Université de Yaoundé I", heading_style))
-        elements.append(Paragraph(f"Généré le {datetime.now().strftime('%d/%m/%Y à %H:%M')}", normal_style))
+        elements.append(Paragraph("Emploi du Temps", _TITLE_STYLE))
+        elements.append(Paragraph("Département d'Informatique - Université de Yaoundé I", _HEADING_STYLE))
+        elements.append(Paragraph(f"Généré le {datetime.now().strftime('%d/%m/%Y à %H:%M')}", _STYLES['Normal']))
         elements.append(Spacer(1, 0.5*cm))
         
-        # Définir les noms des jours et périodes
-        day_names = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi"]
-        period_names = [
-            "7h00-9h55", 
-            "10h05-12h55", 
-            "13h05-15h55", 
-            "16h05-18h55", 
-            "19h05-21h55"
-        ]
+        col_widths = [3*cm] + [4*cm] * len(_DAY_NAMES)
+        row_heights = [1*cm] + [2.5*cm] * len(self.P)
         
+        teacher_display = self.teacher_display
         # Pour chaque classe, créer une section d'emploi du temps
         for l in self.L:
             elements.append(PageBreak())
-            elements.append(Paragraph(f"Emploi du Temps - {l}", heading_style))
+            elements.append(Paragraph(f"Emploi du Temps - {l}", _HEADING_STYLE))
             elements.append(Spacer(1, 0.3*cm))
             
             # Créer un tableau pour l'emploi du temps
-            data = [["Période"] + day_names]
+            data = [["Période", *_DAY_NAMES]]
             
+            timetable_l = timetable[l]
             for p in self.P:
-                row = [period_names[p-1]]
+                row = [_PERIOD_NAMES[p-1]]
                 for d in self.D:
-                    if timetable[l][d][p]:
-                        c, t, r = timetable[l][d][p]
-                        cell_text = f"{c}\nProf: {self.truncate_text(t)}\nSalle: {r}"
-                        row.append(cell_text)
+                    if timetable_l[d][p]:
+                        c, t, r = timetable_l[d][p]
+                        row.append(f"{c}\nProf: {teacher_display[t]}\nSalle: {r}")
                     else:
                         row.append("")
                 data.append(row)
             
-            col_widths = [3*cm] + [4*cm] * len(day_names)
-            table = Table(data, colWidths=col_widths, rowHeights=[1*cm] + [2.5*cm] * len(self.P))
-            
-            # Style du tableau
-            table_style = TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('WORDWRAP', (0, 0), (-1, -1), True),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ])
-            
-            # Ajouter des couleurs selon les périodes
-            for p in self.P:
-                for d_idx in range(len(day_names)):
-                    table_style.add('BACKGROUND', (d_idx+1, p), (d_idx+1, p), period_colors[p])
-            
-            table.setStyle(table_style)
-            elements.append(table)
+            elements.append(Table(data, colWidths=col_widths, rowHeights=row_heights, style=_TABLE_STYLE))
         
         # Générer le PDF
         doc.build(elements)
@@ -473,9 +612,14 @@ class TimeTableGenerator:
         return text[:max_length-3] + '...'
 
 def main():
+    parser = argparse.ArgumentParser(description="Générateur d'emploi du temps")
+    parser.add_argument('--hint', action='store_true',
+                        help="fournir la solution gloutonne au solveur comme point de départ")
+    args = parser.parse_args()
+    
     # Instancier et exécuter le générateur d'emploi du temps
     generator = TimeTableGenerator('subjects.json', 'rooms.json')
-    timetable = generator.generate_timetable()
+    timetable = generator.generate_timetable(use_hint=args.hint)
     
     if timetable:
         print("Emploi du temps généré avec succès!")